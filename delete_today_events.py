@@ -2,31 +2,53 @@ import datetime
 from googleapiclient.errors import HttpError
 from authenticate import authenticate_google_calendar 
 
+# Maximum number of calls Google accepts in a single batch request
+BATCH_SIZE = 50
+
 def delete_todays_study_plan_events(service, calendar_id='primary'):
     # Get today's date in the correct format
     today_start = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).isoformat() + 'Z'
     today_end = datetime.datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999).isoformat() + 'Z'
     
     # Fetch events happening today
+    events = []
+    request = service.events().list(calendarId=calendar_id, timeMin=today_start, timeMax=today_end, singleEvents=True, orderBy='startTime', fields='items(id,summary),nextPageToken')
     try:
-        events_result = service.events().list(calendarId=calendar_id, timeMin=today_start, timeMax=today_end, singleEvents=True, orderBy='startTime').execute()
+        while request is not None:
+            events_result = request.execute()
+            events.extend(events_result.get('items', []))
+            request = service.events().list_next(request, events_result)
     except HttpError as error:
         print(f"An error occurred: {error}")
         return
     
-    events = events_result.get('items', [])
-    
     if not events:
         print("No events found for today.")
         return
     
-    # Delete each event
-    for event in events:
+    # Delete events in batches of up to 50 requests per HTTP round-trip
+    def log_delete(request_id, response, exception):
+        summary = events[int(request_id)]['summary']
+        if exception is not None:
+            print(f"An error occurred while deleting event {summary}: {exception}")
+        else:
+            print(f"Deleted event: {summary} scheduled for today.")
+
+    def execute_batch(batch):
+        # A failure of the whole batch request should not stop the remaining batches
         try:
-            service.events().delete(calendarId=calendar_id, eventId=event['id']).execute()
-            print(f"Deleted event: {event['summary']} scheduled for today.")
+            batch.execute()
         except HttpError as error:
-            print(f"An error occurred while deleting event {event['summary']}: {error}")
+            print(f"An error occurred: {error}")
+
+    batch = service.new_batch_http_request(callback=log_delete)
+    for i, event in enumerate(events):
+        batch.add(service.events().delete(calendarId=calendar_id, eventId=event['id']), request_id=str(i))
+        if (i + 1) % BATCH_SIZE == 0:
+            execute_batch(batch)
+            batch = service.new_batch_http_request(callback=log_delete)
+    if len(events) % BATCH_SIZE:
+        execute_batch(batch)
 
 # Example usage
 if __name__ == '__main__':